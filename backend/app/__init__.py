@@ -2,18 +2,49 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
-from .config import Config
+from sqlalchemy import event
+from .config import get_config
+
+def _register_sqlite_pragmas(engine, pragmas):
+    """
+    Runs the configured PRAGMA statements on every new SQLite connection.
+    PRAGMAs are per-connection, so they have to be applied on connect rather than once.
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+class _SQLAlchemy(SQLAlchemy):
+    """
+    Attaches the app's SQLITE_PRAGMAS listener as Flask-SQLAlchemy creates each engine.
+    """
+    def _make_engine(self, bind_key, options, app):
+        engine = super()._make_engine(bind_key, options, app)
+        _register_sqlite_pragmas(engine, app.config.get('SQLITE_PRAGMAS'))
+        return engine
+
 
 # Initialize the database
-db = SQLAlchemy()
+db = _SQLAlchemy()
 migrate = Migrate()
 
 #These are the database and migration instances. 
 #They need to be initialized separately to ensure they can be accessed throughout the application.
 
-def create_app():
+def create_app(config_class=None):
     app = Flask(__name__)
-    app.config.from_object(Config)  # Load the configuration from Config
+    # Load the configuration: an explicit class, a profile name, or FLASK_CONFIG from the environment
+    if config_class is None or isinstance(config_class, str):
+        config_class = get_config(config_class)
+    app.config.from_object(config_class)
+    config_class.init_app(app)
 
     db.init_app(app)
     migrate.init_app(app, db)
@@ -41,7 +72,8 @@ These are the database and migration instances. They need to be initialized sepa
 create_app function:
 
 This is a factory function that creates and configures the Flask app. It allows for better testing and flexibility, enabling different configurations for development, testing, and production environments.
-app.config.from_object(config_class): Loads configurations from a Config class, which typically resides in a config.py file.
+app.config.from_object(config_class): Loads configurations from a Config class in config.py. The profile (development, testing, production) can be passed by name or picked with the FLASK_CONFIG environment variable.
+_register_sqlite_pragmas: Applies the profile's SQLITE_PRAGMAS (WAL, synchronous, cache sizes, busy timeout) to each new SQLite connection.
 db.init_app(app): Binds the SQLAlchemy instance to the Flask app.
 migrate.init_app(app, db): Binds the migration instance to the app and the database.
 CORS(app): Enables CORS to allow cross-domain requests, useful when the frontend and backend are hosted separately.
@@ -0,0 +1,114 @@
+import os
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+
+
+def _is_sqlite(uri):
+    return uri.startswith('sqlite')
+
+
+'''
+Config:
+Base settings shared by every profile. The profile used by create_app is picked
+with the FLASK_CONFIG environment variable (development, testing, production).
+Without it the base Config is used, which leaves DEBUG off.
+'''
+class Config:
+    SECRET_KEY = os.environ.get('SECRET_KEY')
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///' + os.path.join(basedir, 'app.db'))
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+
+    # PRAGMA name -> value, executed on every new SQLite connection (ignored for other databases)
+    SQLITE_PRAGMAS = {}
+
+    @classmethod
+    def init_app(cls, app):
+        """
+        Hook for settings that depend on the final app.config, called by create_app.
+        """
+        pass
+
+
+class DevelopmentConfig(Config):
+    DEBUG = True
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key')
+
+
+class TestingConfig(Config):
+    TESTING = True
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key')
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL', 'sqlite:///:memory:')
+
+
+'''
+ProductionConfig:
+Pooled engine plus SQLite tuned for concurrent access:
+- WAL journal so readers never block the writer (and vice versa). Readers therefore
+  get a pool sized for the worker threads, with overflow, rather than one that
+  mirrors SQLite's single writer.
+- Writes start with BEGIN IMMEDIATE (the implicit BEGIN pysqlite emits before DML),
+  so a writer takes the lock up front and waits on busy_timeout instead of failing
+  with SQLITE_BUSY when it upgrades a read transaction. Plain reads never take it.
+- synchronous=NORMAL: in WAL mode commits only fsync at checkpoints, still crash-safe.
+- 16 MB page cache per connection (allocated as pages are read) and a 256 MB memory
+  map, which is shared through the OS page cache rather than per connection.
+- busy_timeout so writers queue for the lock instead of failing with "database is locked".
+- A larger per-connection prepared statement cache and SQLAlchemy compiled query cache.
+Pre-ping and recycling only apply to server databases; for a local file they would
+add a query per checkout and throw away warm caches.
+Engine options are built in init_app from the final database URI, so subclasses
+that override SQLALCHEMY_DATABASE_URI get options that match their driver.
+'''
+class ProductionConfig(Config):
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    SQLITE_POOL_SIZE = int(os.environ.get('SQLITE_POOL_SIZE', 10))
+    SQLITE_MAX_OVERFLOW = int(os.environ.get('SQLITE_MAX_OVERFLOW', 10))
+    DB_BUSY_TIMEOUT_MS = int(os.environ.get('DB_BUSY_TIMEOUT_MS', 15000))
+
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,  # negative means KiB, i.e. 16 MB per connection
+        'mmap_size': 268435456,
+        'busy_timeout': DB_BUSY_TIMEOUT_MS,
+        'temp_store': 'MEMORY',
+    }
+
+    @classmethod
+    def init_app(cls, app):
+        if not app.config.get('SECRET_KEY'):
+            raise RuntimeError("SECRET_KEY must be set in the environment for the production profile")
+
+        options = {
+            'pool_timeout': 30,
+            'query_cache_size': 1200,
+        }
+        if _is_sqlite(app.config['SQLALCHEMY_DATABASE_URI']):
+            options.update(pool_size=cls.SQLITE_POOL_SIZE, max_overflow=cls.SQLITE_MAX_OVERFLOW,
+                           connect_args={'cached_statements': 256, 'isolation_level': 'IMMEDIATE'})
+        else:
+            options.update(pool_size=cls.DB_POOL_SIZE, max_overflow=cls.DB_MAX_OVERFLOW,
+                           pool_pre_ping=True, pool_recycle=1800)
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+
+config_by_name = {
+    'development': DevelopmentConfig,
+    'testing': TestingConfig,
+    'production': ProductionConfig,
+    'default': Config,
+}
+
+
+def get_config(name=None):
+    """
+    Returns the config class for the given profile name.
+    Falls back to the FLASK_CONFIG environment variable, then to the base Config.
+    """
+    name = name or os.environ.get('FLASK_CONFIG') or 'default'
+    try:
+        return config_by_name[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown config profile: {name}")
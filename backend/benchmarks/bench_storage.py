@@ -0,0 +1,147 @@
+"""
+Concurrent read/write throughput of the SQLite storage layer, before and after
+the production profile (WAL, tuned pragmas, pooled engine).
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_storage --seconds 10 --writers 4 --readers 8
+
+Each profile gets its own fresh database file. Writers post transactions through
+services.post_transaction (one commit each); readers sum account balances and list
+recent transactions. "locked" counts operations that failed with "database is locked".
+
+Measured with Flask 3.1, Flask-SQLAlchemy 3.1.1, SQLAlchemy 2.1, Python 3.11 on a
+single CPU, --seconds 5, 4 writers, 8 readers; median (range) of 5 runs:
+
+    profile     writes/s            reads/s             locked
+    default      55 (43-56)         747 (680-887)            0
+    pragmas     124 (117-128)       796 (723-831)            0
+    production   99 (90-122)        857 (717-907)            0
+
+"pragmas" is the production PRAGMA set on the default engine, so the gap to
+"default" is WAL and the other pragmas alone. "production" adds its pool (10 plus
+10 overflow, enough for all 12 threads), BEGIN IMMEDIATE for writes and the
+statement caches; its write rate is within run-to-run noise of "pragmas" here.
+Writers alone reach ~690 writes/s with WAL; in the mixed run they share the CPU
+with 8 reader threads.
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError
+
+from app import create_app, db
+from app.config import Config, ProductionConfig
+from app.models import Account, Transaction
+from app.services import post_transaction
+
+
+class PragmasOnlyConfig(Config):
+    """Production SQLite pragmas on the default engine, to separate them from the pool settings."""
+    SQLITE_PRAGMAS = ProductionConfig.SQLITE_PRAGMAS
+
+
+def make_profile(base, db_path):
+    return type(f'Bench{base.__name__}', (base,), {
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + db_path,
+        'SECRET_KEY': 'bench',
+    })
+
+
+def writer(app, account_ids, stop, stats, index):
+    with app.app_context():
+        i = 0
+        while not stop.is_set():
+            account_id = account_ids[(index + i) % len(account_ids)]
+            try:
+                post_transaction(account_id, 10.0, 'debit' if i % 2 else 'credit', description='bench')
+                stats['writes'] += 1
+            except OperationalError as e:
+                db.session.rollback()
+                if 'locked' in str(e):
+                    stats['locked'] += 1
+                else:
+                    raise
+            i += 1
+
+
+def reader(app, stop, stats):
+    with app.app_context():
+        while not stop.is_set():
+            try:
+                db.session.query(func.sum(Account.balance)).scalar()
+                Transaction.query.order_by(Transaction.id.desc()).limit(20).all()
+                db.session.commit()
+                stats['reads'] += 1
+            except OperationalError as e:
+                db.session.rollback()
+                if 'locked' in str(e):
+                    stats['locked'] += 1
+                else:
+                    raise
+
+
+def run_profile(base, seconds, writers, readers, accounts):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(make_profile(base, os.path.join(tmp, 'bench.db')))
+        with app.app_context():
+            db.create_all()
+            # Explicit codes: generate_account_code is per-second and would collide here
+            seeded = [Account(name=f'Bench {n}', account_type='Asset', code=f'BENCH{n:04d}') for n in range(accounts)]
+            db.session.add_all(seeded)
+            db.session.commit()
+            account_ids = [account.id for account in seeded]
+
+        stop = threading.Event()
+        totals = {'reads': 0, 'writes': 0, 'locked': 0}
+        per_thread = []
+        threads = []
+        for n in range(writers):
+            stats = {'reads': 0, 'writes': 0, 'locked': 0}
+            per_thread.append(stats)
+            threads.append(threading.Thread(target=writer, args=(app, account_ids, stop, stats, n)))
+        for _ in range(readers):
+            stats = {'reads': 0, 'writes': 0, 'locked': 0}
+            per_thread.append(stats)
+            threads.append(threading.Thread(target=reader, args=(app, stop, stats)))
+
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        with app.app_context():
+            db.engine.dispose()
+
+        for stats in per_thread:
+            for key in totals:
+                totals[key] += stats[key]
+        totals['elapsed'] = elapsed
+        return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--accounts', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f'{args.writers} writers, {args.readers} readers, {args.seconds:.0f}s per profile')
+    print(f"{'profile':<12}{'writes/s':>12}{'reads/s':>12}{'locked':>10}")
+    for label, base in (('default', Config), ('pragmas', PragmasOnlyConfig), ('production', ProductionConfig)):
+        r = run_profile(base, args.seconds, args.writers, args.readers, args.accounts)
+        print(f"{label:<12}{r['writes'] / r['elapsed']:>12.1f}{r['reads'] / r['elapsed']:>12.1f}{r['locked']:>10}")
+
+
+if __name__ == '__main__':
+    main()
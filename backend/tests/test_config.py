@@ -0,0 +1,107 @@
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from app import create_app, db
+from app.config import Config, DevelopmentConfig, TestingConfig, ProductionConfig, get_config
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('development', DevelopmentConfig),
+    ('testing', TestingConfig),
+    ('production', ProductionConfig),
+    ('default', Config),
+])
+def test_get_config_by_name(name, expected):
+    assert get_config(name) is expected
+
+
+def test_get_config_falls_back_to_default(monkeypatch):
+    monkeypatch.delenv('FLASK_CONFIG', raising=False)
+    assert get_config() is Config
+    monkeypatch.setenv('FLASK_CONFIG', '')
+    assert get_config() is Config
+    monkeypatch.setenv('FLASK_CONFIG', 'production')
+    assert get_config() is ProductionConfig
+
+
+def test_get_config_unknown_name():
+    with pytest.raises(ValueError):
+        get_config('staging')
+
+
+def test_default_app_is_not_debug(monkeypatch):
+    monkeypatch.delenv('FLASK_CONFIG', raising=False)
+    assert create_app().debug is False
+
+
+def test_production_requires_secret_key(tmp_path):
+    profile = type('NoSecret', (ProductionConfig,), {
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + str(tmp_path / 'app.db'),
+        'SECRET_KEY': None,
+    })
+    with pytest.raises(RuntimeError):
+        create_app(profile)
+
+
+def test_production_engine_options_follow_final_uri(tmp_path):
+    sqlite_profile = type('SqliteProd', (ProductionConfig,), {
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + str(tmp_path / 'app.db'),
+        'SECRET_KEY': 'test',
+    })
+    app = create_app(sqlite_profile)
+    options = app.config['SQLALCHEMY_ENGINE_OPTIONS']
+    assert options['pool_size'] == ProductionConfig.SQLITE_POOL_SIZE
+    assert options['max_overflow'] == ProductionConfig.SQLITE_MAX_OVERFLOW
+    assert options['connect_args'] == {'cached_statements': 256, 'isolation_level': 'IMMEDIATE'}
+    assert 'pool_pre_ping' not in options
+    assert 'pool_recycle' not in options
+
+    pg_profile = type('PostgresProd', (ProductionConfig,), {
+        'SQLALCHEMY_DATABASE_URI': 'postgresql://user@localhost/app',
+        'SECRET_KEY': 'test',
+    })
+    # Only the config hook: Flask-SQLAlchemy creates engines in init_app, which would need a Postgres driver
+    app = Flask(__name__)
+    app.config.from_object(pg_profile)
+    pg_profile.init_app(app)
+    assert 'connect_args' not in app.config['SQLALCHEMY_ENGINE_OPTIONS']
+    assert app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_size'] == ProductionConfig.DB_POOL_SIZE
+    assert app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_pre_ping'] is True
+
+
+def test_production_sqlite_pragmas_applied_on_connect(tmp_path):
+    profile = type('SqliteProd', (ProductionConfig,), {
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + str(tmp_path / 'app.db'),
+        'SECRET_KEY': 'test',
+    })
+    app = create_app(profile)
+    with app.app_context():
+        with db.engine.connect() as conn:
+            pragma = lambda name: conn.execute(text(f'PRAGMA {name}')).scalar()
+            assert pragma('journal_mode') == 'wal'
+            assert pragma('synchronous') == 1  # NORMAL
+            assert pragma('cache_size') == -16000
+            assert pragma('mmap_size') == 268435456
+            assert pragma('busy_timeout') == ProductionConfig.DB_BUSY_TIMEOUT_MS
+            assert pragma('temp_store') == 2  # MEMORY
+        db.engine.dispose()
+
+
+def test_production_sqlite_writes_begin_immediate(tmp_path):
+    profile = type('SqliteProd', (ProductionConfig,), {
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + str(tmp_path / 'app.db'),
+        'SECRET_KEY': 'test',
+    })
+    app = create_app(profile)
+    with app.app_context():
+        db.create_all()
+        statements = []
+        with db.engine.connect() as conn:
+            conn.connection.driver_connection.set_trace_callback(statements.append)
+            conn.execute(text('SELECT count(*) FROM accounts')).scalar()
+            assert not any(s.startswith('BEGIN') for s in statements)
+            conn.execute(text("INSERT INTO accounts (name, account_type, code) VALUES ('Cash', 'Asset', '1001')"))
+            conn.commit()
+        assert 'BEGIN IMMEDIATE' in statements
+        db.engine.dispose()